@@ -0,0 +1,65 @@
+"""On-disk cache of HTTP response bodies for pages fetched during ingestion.
+
+Entries are keyed by canonical URL (tracking parameters stripped) and keep
+the `ETag` / `Last-Modified` validators next to the gzip-compressed body,
+so a stale entry can be revalidated with a 304 instead of a full download.
+The cache lives at `$HTTP_CACHE_DIR` (default `/tmp/aggr`) and is shared
+between processes.
+"""
+from __future__ import annotations
+
+import gzip
+import os
+import threading
+import time
+from typing import NamedTuple, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import diskcache
+
+# Entries younger than this are served without touching the network
+FRESH_SECONDS = 900
+# Stale entries are kept this long so they can still be revalidated
+RETAIN_SECONDS = 7 * 24 * 3600
+SIZE_LIMIT = 256 * 1024 * 1024
+
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src"})
+
+
+def canonical_url(url: str) -> str:
+    """Return `url` with a lowercased scheme/host and no fragment or tracking params."""
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    ]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", urlencode(query), ""))
+
+
+class CachedBody(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    encoding: Optional[str]
+    gz_body: bytes
+    stored_at: float
+
+    @property
+    def body(self) -> bytes:
+        return gzip.decompress(self.gz_body)
+
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < FRESH_SECONDS
+
+
+_cache: Optional[diskcache.Cache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> diskcache.Cache:
+    """Return the process-wide body cache, opened lazily."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = diskcache.Cache(os.getenv("HTTP_CACHE_DIR", "/tmp/aggr"), size_limit=SIZE_LIMIT)
+        return _cache
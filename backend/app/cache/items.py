@@ -0,0 +1,48 @@
+"""On-disk cache of the normalized items produced per feed URL.
+
+Pairs with the conditional requests in `backend.app.ingest.rss`: each
+entry is a `CachedFeed` holding the items of the last successful fetch
+together with the validators of the response they were parsed from, so
+the two can never drift apart. When a feed answers 304 (or resends an
+identical body) its cached items are served instead of being lost. Pass
+`get_cache()` as the `cache=` argument of `rss.fetch_recent` /
+`rss.fetch_recent_async`. The cache lives at `$FEED_ITEMS_CACHE_DIR`
+(default `/tmp/aggr-items`).
+"""
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import diskcache
+
+
+class Validators(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_sha1: Optional[str]
+
+
+class CachedFeed(NamedTuple):
+    # The URL the items were actually parsed from: the cache key itself, or
+    # the alternate feed advertised by the HTML page at that key
+    feed_url: str
+    validators: Validators
+    items: List[Dict[str, Any]]
+    # The `hours` window `items` were cut to; a wider window cannot be served
+    # from them and needs a full fetch
+    hours: int = 0
+
+
+_cache: Optional[diskcache.Cache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> diskcache.Cache:
+    """Return the process-wide items cache, opened lazily."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = diskcache.Cache(os.getenv("FEED_ITEMS_CACHE_DIR", "/tmp/aggr-items"))
+        return _cache
@@ -0,0 +1,80 @@
+"""Persistent set of items already emitted by earlier ingestion runs.
+
+Each item is remembered as a 64-bit BLAKE2b digest of its id (or link),
+stored as packed little-endian integers in `$SEEN_GUIDS_PATH` (default
+`.seen_guids.bin`). The file is loaded into a `set[int]` once and only
+the digests added since are appended on `flush()`. Callers record keys
+with `update()` only once the items they belong to are safely written out,
+so a failed write never marks them as seen.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+from array import array
+from typing import Iterable, List, Optional
+
+
+def _digest(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SeenSet:
+    """Append-only on-disk set of item keys. Safe to share between threads."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending: List[int] = []
+        digests = array("Q")
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+            # Ignore a torn trailing record from an interrupted write
+            digests.frombytes(data[: len(data) - len(data) % digests.itemsize])
+        except FileNotFoundError:
+            pass
+        if sys.byteorder == "big":
+            digests.byteswap()
+        self._seen = set(digests)
+
+    def __contains__(self, key: str) -> bool:
+        digest = _digest(key)
+        with self._lock:
+            return digest in self._seen
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Record `keys`; the new ones are appended to the file on the next `flush()`."""
+        digests = [_digest(key) for key in keys]
+        with self._lock:
+            for digest in digests:
+                if digest not in self._seen:
+                    self._seen.add(digest)
+                    self._pending.append(digest)
+
+    def flush(self) -> None:
+        """Append the keys added since the last flush to the file."""
+        with self._lock:
+            if not self._pending:
+                return
+            digests = array("Q", self._pending)
+            if sys.byteorder == "big":
+                digests.byteswap()
+            with open(self.path, "ab") as fh:
+                fh.write(digests.tobytes())
+            self._pending.clear()
+
+
+_seen: Optional[SeenSet] = None
+_seen_lock = threading.Lock()
+
+
+def get_seen() -> SeenSet:
+    """Return the process-wide seen set, loaded lazily from `$SEEN_GUIDS_PATH`."""
+    global _seen
+    with _seen_lock:
+        if _seen is None:
+            _seen = SeenSet(os.getenv("SEEN_GUIDS_PATH", ".seen_guids.bin"))
+        return _seen
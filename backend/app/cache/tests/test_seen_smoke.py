@@ -0,0 +1,36 @@
+"""Smoke tests for the persistent seen-items set without network access."""
+from __future__ import annotations
+
+from backend.app.cache.seen import SeenSet
+
+
+def test_seen_set_round_trips_through_the_file(tmp_path):
+    path = str(tmp_path / "seen.bin")
+    seen = SeenSet(path)
+    assert "a" not in seen
+
+    seen.update(["a", "b", "a"])
+    assert "a" in seen and "b" in seen
+    seen.flush()
+    seen.update(["b", "c"])
+    seen.flush()
+
+    # Only new digests are appended: a, b, then c
+    assert (tmp_path / "seen.bin").stat().st_size == 3 * 8
+    reloaded = SeenSet(path)
+    assert all(key in reloaded for key in ("a", "b", "c"))
+    assert "d" not in reloaded
+
+
+def test_seen_set_ignores_a_torn_trailing_record(tmp_path):
+    path = tmp_path / "seen.bin"
+    seen = SeenSet(str(path))
+    seen.update(["a"])
+    seen.flush()
+    # An interrupted append leaves a partial record behind
+    with open(path, "ab") as fh:
+        fh.write(b"\x01\x02\x03")
+
+    reloaded = SeenSet(str(path))
+    assert "a" in reloaded
+    assert len(reloaded._seen) == 1
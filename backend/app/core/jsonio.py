@@ -0,0 +1,64 @@
+"""JSON encode/decode and output helpers for the ingestion code.
+
+`dumps` / `loads` use orjson when it is installed and fall back to the
+stdlib `json` module otherwise; both produce the same documents. The
+payload is serialized in memory first and handed to the kernel in a
+single `write(2)` by `write_bytes` (looping only on short writes),
+instead of the many small writes a text-mode `json.dump` issues through
+the file buffer. `write_array` streams an array item by item for outputs
+too large to serialize in one piece.
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional, json is the fallback
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize `obj` as 2-space indented UTF-8 JSON (non-ASCII kept as is)."""
+    if orjson is None:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+def loads(body: bytes | str) -> Any:
+    """Decode a JSON document, falling back to `json` for non-UTF-8 payloads."""
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(body)
+
+
+def write_bytes(path: str, data: bytes) -> None:
+    """Write `data` to `path`, truncating any existing file."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_array(path: str, items: Iterable[Any]) -> int:
+    """Stream `items` to `path` as a JSON array laid out like `dumps`; returns the item count.
+
+    Only one serialized item is held in memory at a time.
+    """
+    count = 0
+    with open(path, "wb") as fh:
+        for item in items:
+            # JSON strings cannot contain raw newlines, so this only re-indents structure
+            fh.write(b",\n  " if count else b"[\n  ")
+            fh.write(dumps(item).replace(b"\n", b"\n  "))
+            count += 1
+        fh.write(b"\n]" if count else b"[]")
+    return count
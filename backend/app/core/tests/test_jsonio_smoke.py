@@ -0,0 +1,29 @@
+"""Smoke tests for the JSON output helpers without network access."""
+from __future__ import annotations
+
+import pytest
+
+from backend.app.core import jsonio
+
+ITEMS = [
+    {"id": "1", "title": "Café — \"quoted\"", "tags": ["a", "b"], "authors": []},
+    {"id": "2", "title": None, "summary": "line one\nline two", "nested": {"k": [1, 2.5, True]}},
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_impl(request, monkeypatch):
+    if request.param == "orjson":
+        if jsonio.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("items", [ITEMS, ITEMS[:1], []], ids=["many", "one", "empty"])
+def test_write_array_matches_dumps(tmp_path, json_impl, items):
+    path = tmp_path / "out.json"
+    assert jsonio.write_array(str(path), iter(items)) == len(items)
+    assert path.read_bytes() == jsonio.dumps(items)
+    assert jsonio.loads(path.read_bytes()) == items
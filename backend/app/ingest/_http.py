@@ -0,0 +1,181 @@
+"""Shared HTTP session for the ingestion helpers.
+
+All synchronous fetches go through `SESSION` so TCP/TLS connections are
+pooled and kept alive across feeds, article pages and social endpoints
+instead of being re-established for every `requests.get` call.
+`async_client` / `afetch` are the asyncio counterparts used for concurrent
+collection. `get_limited` / `aread_limited` stream bodies and refuse
+anything larger than `MAX_BYTES`; `get_cached` layers the on-disk body
+cache on top for HTML pages.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import importlib.util
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from backend.app.cache import bodies
+
+USER_AGENT = "ai-news-aggregator/1.0 (+https://example.local)"
+
+# Largest (decoded) response body we are willing to hold in memory
+MAX_BYTES = 4 * 1024 * 1024
+
+# Bounds for the concurrent async fan-out (`async_client` / `afetch`)
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+MAX_CONNECTIONS_PER_HOST = 4
+
+# httpx only speaks HTTP/2 when the optional `h2` package is installed
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = USER_AGENT
+
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    # Retry transient upstream failures; the final response is returned as-is
+    # so callers keep seeing `HTTPError` from `raise_for_status()`.
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+def _check_length(url: str, headers: Any) -> None:
+    length = headers.get("content-length")
+    if length and length.isdigit() and int(length) > MAX_BYTES:
+        raise ValueError(f"response too large: {url} ({length} bytes)")
+
+
+def get_limited(url: str, **kwargs: Any) -> requests.Response:
+    """`SESSION.get` that streams the body and rejects it past `MAX_BYTES`.
+
+    The returned response is fully read, so `.content`, `.text` and
+    `.json()` work as usual. Raises `ValueError` for oversized bodies.
+    """
+    with SESSION.get(url, stream=True, **kwargs) as resp:
+        _check_length(url, resp.headers)
+        body = resp.raw.read(MAX_BYTES + 1, decode_content=True)
+    if len(body) > MAX_BYTES:
+        raise ValueError(f"response too large: {url}")
+    resp._content = body
+    return resp
+
+
+def async_client() -> httpx.AsyncClient:
+    """Return an `httpx.AsyncClient` configured like `SESSION` for concurrent fetches.
+
+    With HTTP/2 available, requests to the same host (reddit.com, a CDN
+    serving many feeds) multiplex over one connection instead of paying a
+    TCP+TLS handshake each.
+    """
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+        follow_redirects=True,
+        http2=HTTP2,
+    )
+
+
+async def afetch(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: int = 10,
+    params: Optional[Dict[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    slots: Optional[Dict[str, asyncio.Semaphore]] = None,
+) -> tuple[str, bytes, httpx.Headers]:
+    """GET `url` on the event loop and return (final_url, body, headers).
+
+    `slots` maps a host to a semaphore bounding the requests in flight to
+    that host. Raises `httpx.HTTPError` on network errors and non-2xx codes
+    (including 304 for conditional requests), and `ValueError` for bodies
+    larger than `MAX_BYTES`.
+    """
+    if slots is None:
+        return await _aget(client, url, timeout, params, headers)
+    host = httpx.URL(url).host
+    if host not in slots:
+        slots[host] = asyncio.Semaphore(MAX_CONNECTIONS_PER_HOST)
+    async with slots[host]:
+        return await _aget(client, url, timeout, params, headers)
+
+
+async def _aget(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: int,
+    params: Optional[Dict[str, str]],
+    headers: Optional[Dict[str, str]],
+) -> tuple[str, bytes, httpx.Headers]:
+    async with client.stream("GET", url, params=params, headers=headers, timeout=timeout) as resp:
+        resp.raise_for_status()
+        body = await aread_limited(resp)
+    return str(resp.url), body, resp.headers
+
+
+async def aread_limited(resp: httpx.Response) -> bytes:
+    """Read a streamed httpx response body, rejecting it past `MAX_BYTES`."""
+    _check_length(str(resp.url), resp.headers)
+    chunks = []
+    size = 0
+    async for chunk in resp.aiter_bytes():
+        size += len(chunk)
+        if size > MAX_BYTES:
+            raise ValueError(f"response too large: {resp.url}")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def get_cached(url: str, timeout: int = 10) -> tuple[bytes, Optional[str]]:
+    """GET `url` through the on-disk body cache and return (body, encoding).
+
+    Fresh entries skip the network entirely; stale ones are revalidated with
+    a conditional request. Raises `requests` exceptions on network errors
+    and `ValueError` for bodies larger than `MAX_BYTES`.
+    """
+    key = bodies.canonical_url(url)
+    cache = bodies.get_cache()
+    entry: Optional[bodies.CachedBody] = cache.get(key)
+    if entry is not None and entry.is_fresh():
+        return entry.body, entry.encoding
+
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+    resp = get_limited(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and entry is not None:
+        cache.set(key, entry._replace(stored_at=time.time()), expire=bodies.RETAIN_SECONDS)
+        return entry.body, entry.encoding
+    resp.raise_for_status()
+
+    entry = bodies.CachedBody(
+        resp.headers.get("etag"),
+        resp.headers.get("last-modified"),
+        resp.encoding,
+        gzip.compress(resp.content),
+        time.time(),
+    )
+    cache.set(key, entry, expire=bodies.RETAIN_SECONDS)
+    return resp.content, resp.encoding
+
+
+def decode(body: bytes, encoding: Optional[str]) -> str:
+    """Decode `body` like `requests.Response.text` would."""
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
@@ -6,64 +6,379 @@ by a local LLM. Entries without a published date are ignored.
 """
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-import calendar
-from typing import Iterable, List, Dict, Any, Optional
-from urllib.parse import urljoin
+from email.utils import parsedate_to_datetime
+import hashlib
+from io import BytesIO
+import multiprocessing
+import os
+import threading
+from typing import Iterable, List, Dict, Any, MutableMapping, Optional
+from urllib.parse import urljoin, urlsplit
 
 import feedparser
-from bs4 import BeautifulSoup
+import httpx
+from lxml import etree
+import lxml.html
+from selectolax.lexbor import LexborHTMLParser
 
+from backend.app.cache.items import CachedFeed, Validators
+from backend.app.ingest._http import afetch, get_cached, get_limited
 
-def _struct_time_to_dt(st):
-    if st is None:
-        return None
-    # Use calendar.timegm to convert a UTC struct_time to a timestamp
-    try:
-        ts = calendar.timegm(st)
-    except Exception:
-        # Fallback: convert via time.mktime (may use local tz)
-        import time
 
-        ts = time.mktime(st)
-    return datetime.fromtimestamp(ts, tz=timezone.utc)
+# Shared pool for article page fetches; the work is network-bound so threads suffice.
+_ARTICLE_POOL = ThreadPoolExecutor(max_workers=int(os.getenv("INGEST_WORKERS", "8")))
+
+# Summaries at least this long are treated as the full text, so the article
+# page is not fetched for them.
+MIN_CONTENT_LEN = 800
+# Comma-separated hosts (e.g. paywalled sites) whose article pages are never
+# fetched; subdomains match too.
+_SKIP_ARTICLE_FETCH_HOSTS = frozenset(
+    h.strip().lower() for h in os.getenv("INGEST_SKIP_ARTICLE_FETCH_HOSTS", "").split(",") if h.strip()
+)
+
+# Process pool for CPU-bound XML/HTML parsing, which a thread pool would serialize
+# on the GIL. Created on first use; see `get_parse_pool`.
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+
 
+def get_parse_pool() -> ProcessPoolExecutor:
+    """Return the shared parsing process pool (one worker per CPU).
 
-def fetch_feed(url: str, timeout: int = 10) -> feedparser.FeedParserDict:
+    Workers are spawned, so entry-point scripts must keep their
+    `if __name__ == "__main__":` guard.
+    """
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            # spawn: forking a process that already runs fetch threads is unsafe
+            _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+        return _PARSE_POOL
+
+
+def _parse_datetime(value: str) -> Optional[datetime]:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date into an aware UTC datetime."""
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    # Whole seconds, as feedparser's struct_time based dates were
+    return dt.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _entry_datetime(e: Any) -> Optional[datetime]:
+    """Return the published (else updated) time of a feed entry.
+
+    The raw date string is parsed with the stdlib; for formats it rejects,
+    the `*_parsed` time feedparser computed is used. `_fast_parse` entries
+    carry no such field, which is why it defers those feeds to feedparser.
+    """
+    for key in ("published", "updated"):
+        raw = e.get(key)
+        dt = _parse_datetime(raw) if raw else None
+        if dt is None:
+            st = e.get(f"{key}_parsed")
+            if st:
+                # feedparser normalizes parsed dates to UTC
+                dt = datetime(*st[:6], tzinfo=timezone.utc)
+        if dt is not None:
+            return dt
+    return None
+
+
+def fetch_feed(url: str, timeout: int = 10, previous: Optional[CachedFeed] = None) -> feedparser.FeedParserDict:
     """Fetch and parse a feed from `url`.
 
     Returns the feedparser-parsed object. Network errors raise an
     exception from `requests` (caller may catch them and treat as
-    "not available").
+    "not available"). With `previous` (the cached record of the last
+    fetch of `url`), the request is conditional on its validators; an
+    unchanged feed yields an empty parsed feed with `unchanged` set.
+    Otherwise the result carries the `feed_url` its entries were parsed
+    from and the `validators` of that response.
     """
-    import requests
-
-    headers = {"User-Agent": "ai-news-aggregator/1.0 (+https://example.local)"}
-    resp = requests.get(url, headers=headers, timeout=timeout)
+    resp = get_limited(url, headers=conditional_headers(previous, url), timeout=timeout)
+    if resp.status_code == 304:
+        return _unchanged_feed()
     resp.raise_for_status()
 
-    content_type = resp.headers.get("content-type", "")
-    parsed = feedparser.parse(resp.content)
+    return parse_feed_response(url, resp.content, resp.headers, timeout=timeout, previous=previous)
+
+
+def _unchanged_feed() -> feedparser.FeedParserDict:
+    return feedparser.FeedParserDict(entries=[], feed={}, unchanged=True)
+
+
+def conditional_headers(previous: Optional[CachedFeed], url: str) -> Dict[str, str]:
+    """Return request headers for `url` carrying the validators of `previous`, if they belong to it."""
+    headers: Dict[str, str] = {}
+    if previous is None or previous.feed_url != url:
+        return headers
+    if previous.validators.etag:
+        headers["If-None-Match"] = previous.validators.etag
+    if previous.validators.last_modified:
+        headers["If-Modified-Since"] = previous.validators.last_modified
+    return headers
+
+
+def response_validators(headers: Any, content: bytes) -> Validators:
+    """The validators of a successful response, to be cached with the items parsed from it."""
+    return Validators(headers.get("etag"), headers.get("last-modified"), hashlib.sha1(content).hexdigest())
+
+
+def is_unchanged(previous: Optional[CachedFeed], url: str, content: bytes) -> bool:
+    """True if a 200 body for `url` is byte-identical to the one `previous` was parsed from."""
+    return bool(
+        previous is not None
+        and previous.feed_url == url
+        and previous.validators.body_sha1 == hashlib.sha1(content).hexdigest()
+    )
+
+
+def parse_feed_response(
+    url: str, content: bytes, headers: Any, timeout: int = 10, previous: Optional[CachedFeed] = None
+) -> feedparser.FeedParserDict:
+    """Parse a successful response for `url`.
+
+    `headers` is any case-insensitive mapping of response headers. Servers
+    that ignore conditional requests are caught by comparing the body hash
+    with `previous`.
+    """
+    if is_unchanged(previous, url, content):
+        return _unchanged_feed()
+
+    parsed = parse_feed(url, content, headers.get("content-type", ""), timeout=timeout, previous=previous)
+    if not parsed.get("unchanged") and "feed_url" not in parsed:
+        parsed["feed_url"] = url
+        parsed["validators"] = response_validators(headers, content)
+    return parsed
+
+
+def parse_feed(
+    url: str, content: bytes, content_type: str = "", timeout: int = 10, previous: Optional[CachedFeed] = None
+) -> feedparser.FeedParserDict:
+    """Parse an already-downloaded response body for `url` as a feed.
+
+    If the body is an HTML page rather than a feed, the page is searched
+    for an alternate feed link which is then fetched (conditionally on
+    `previous`) and parsed instead.
+    """
+    parsed = _parse_bytes(content)
 
     # If response already looks like a feed, return it
     if parsed.entries:
         return parsed
 
     # If the content-type indicates XML/Feed, return parsed anyway
-    if "xml" in content_type or "rss" in content_type or "atom" in content_type:
+    if _is_feed_content_type(content_type):
         return parsed
 
     # Otherwise, try to resolve an alternate feed link from the HTML page
-    feed_url = _resolve_feed_url_from_html(url, resp.content)
+    feed_url = _resolve_feed_url_from_html(url, content)
     if feed_url:
-        resp2 = requests.get(feed_url, headers=headers, timeout=timeout)
+        resp2 = get_limited(feed_url, headers=conditional_headers(previous, feed_url), timeout=timeout)
+        if resp2.status_code == 304:
+            return _unchanged_feed()
         resp2.raise_for_status()
-        return feedparser.parse(resp2.content)
+        if is_unchanged(previous, feed_url, resp2.content):
+            return _unchanged_feed()
+        parsed = _parse_bytes(resp2.content)
+        parsed["feed_url"] = feed_url
+        parsed["validators"] = response_validators(resp2.headers, resp2.content)
+        return parsed
 
     # Fallback: return the original parsed result (may be empty)
     return parsed
 
 
+def _is_feed_content_type(content_type: str) -> bool:
+    return any(tok in content_type for tok in _FEED_TYPE_TOKENS)
+
+
+def parse_feed_bytes(
+    url: str, content: bytes, content_type: str = "", hours: int = 24
+) -> tuple[List[Dict[str, Any]], Optional[str]]:
+    """Parse feed bytes into recent normalized items without any network I/O.
+
+    Top-level and picklable so it can run in `get_parse_pool()`. Article
+    pages are not fetched here (see `fill_article_content`). If `content`
+    is an HTML page rather than a feed, returns `([], alternate_feed_url)`
+    so the caller can fetch the advertised feed and parse that instead.
+    """
+    parsed = _parse_bytes(content)
+    if not parsed.entries and not _is_feed_content_type(content_type):
+        return [], _resolve_feed_url_from_html(url, content)
+
+    feed_title = parsed.feed.get("title") if getattr(parsed, "feed", None) else None
+    return parse_entries(parsed.entries, feed_title=feed_title, fetch_articles=False, cutoff=_cutoff(hours)), None
+
+
+def _parse_bytes(content: bytes) -> feedparser.FeedParserDict:
+    """Parse feed bytes with the lxml fast path, falling back to feedparser."""
+    # The HTML in summaries/content is reduced to plain text by `_html_to_text`
+    # anyway, so skip feedparser's own sanitizer and relative-URI rewriting.
+    return _fast_parse(content) or feedparser.parse(content, sanitize_html=False, resolve_relative_uris=False)
+
+
+def _inner_markup(elem: Any) -> str:
+    """Return the text of `elem` including any child markup (Atom xhtml content)."""
+    if len(elem) == 0:
+        return elem.text or ""
+    return (elem.text or "") + "".join(etree.tostring(child, encoding="unicode") for child in elem)
+
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+
+# Fully qualified entry child tags mapped to the field they fill. Elements in
+# any other namespace (media:, itunes:, ...) are ignored, so e.g. a
+# <media:title> cannot overwrite the item title.
+_FAST_FIELDS = {
+    "title": "title",
+    _ATOM + "title": "title",
+    "link": "link",
+    _ATOM + "link": "link",
+    "guid": "id",
+    _ATOM + "id": "id",
+    "pubDate": "published",
+    _ATOM + "published": "published",
+    _DC + "date": "published",
+    _ATOM + "updated": "updated",
+    "description": "summary",
+    _ATOM + "summary": "summary",
+    _CONTENT + "encoded": "content",
+    _ATOM + "content": "content",
+    "author": "author",
+    _ATOM + "author": "author",
+    _DC + "creator": "author",
+    "category": "category",
+    _ATOM + "category": "category",
+}
+_FAST_ENTRY_TAGS = ("item", _ATOM + "entry")
+_FAST_FEED_TAGS = ("channel", _ATOM + "feed")
+
+
+def _fast_entry(elem: Any) -> Optional[feedparser.FeedParserDict]:
+    """Convert an RSS <item> or Atom <entry> element into a feedparser-like entry.
+
+    Returns None if the entry has a date the stdlib cannot read.
+    """
+    entry = feedparser.FeedParserDict()
+    authors: list[feedparser.FeedParserDict] = []
+    tags: list[feedparser.FeedParserDict] = []
+
+    for child in elem:
+        # Comments and processing instructions (non-string tags) never match
+        name = _FAST_FIELDS.get(child.tag)
+        if name is None:
+            continue
+        if name == "link":
+            href = child.get("href")
+            if href is None:
+                entry["link"] = (child.text or "").strip()
+            elif child.get("rel", "alternate") == "alternate" and "link" not in entry:
+                entry["link"] = href
+        elif name == "summary":
+            entry["summary"] = _inner_markup(child)
+        elif name == "content":
+            entry["content"] = [feedparser.FeedParserDict(value=_inner_markup(child))]
+        elif name == "author":
+            # Atom nests <name>; RSS/DC carry the text directly
+            author_name = child.findtext(_ATOM + "name") if len(child) else child.text
+            if author_name and author_name.strip():
+                authors.append(feedparser.FeedParserDict(name=author_name.strip()))
+        elif name == "category":
+            term = child.get("term") or child.text
+            if term and term.strip():
+                tags.append(feedparser.FeedParserDict(term=term.strip()))
+        else:
+            value = (child.text or "").strip()
+            # feedparser understands many more date formats than the stdlib
+            if name in ("published", "updated") and value and _parse_datetime(value) is None:
+                return None
+            entry[name] = value
+
+    # Like feedparser, content-only items (no <description>/<summary>) reuse the content as summary
+    if "summary" not in entry and "content" in entry:
+        entry["summary"] = entry["content"][0]["value"]
+    if authors:
+        entry["author"] = authors[0]["name"]
+        entry["authors"] = authors
+    if tags:
+        entry["tags"] = tags
+    return entry
+
+
+def _fast_parse(content: bytes) -> Optional[feedparser.FeedParserDict]:
+    """Parse RSS 2.0 / Atom 1.0 bytes with `lxml.etree.iterparse`.
+
+    Returns an object exposing `.entries` and `.feed` like feedparser, or
+    None if the document is not well-formed XML, has no entries, or has a
+    date the stdlib cannot read, so the caller can fall back to
+    `feedparser.parse`. Each item is cleared once converted, keeping
+    memory flat for large feeds. Only internal entities are expanded;
+    documents relying on external ones (XXE payloads, DTD entities such as
+    RSS 0.91's `&eacute;`) are left to feedparser.
+    """
+    entries: list[feedparser.FeedParserDict] = []
+    feed_title = None
+    try:
+        # Feeds are untrusted input: only expand entities declared in the document
+        # itself (libxml2's amplification limits stay on), never fetch DTDs or
+        # external entities. Undefined ones are a syntax error, so feedparser
+        # handles those documents.
+        events = etree.iterparse(
+            BytesIO(content), events=("end",), resolve_entities="internal", no_network=True, huge_tree=False
+        )
+        for _, elem in events:
+            if elem.tag in _FAST_ENTRY_TAGS:
+                entry = _fast_entry(elem)
+                if entry is None:
+                    return None
+                entries.append(entry)
+                elem.clear()
+                # Drop already-processed siblings as well
+                parent = elem.getparent()
+                while parent is not None and elem.getprevious() is not None:
+                    del parent[0]
+            elif elem.tag in ("title", _ATOM + "title") and feed_title is None:
+                parent = elem.getparent()
+                if parent is not None and parent.tag in _FAST_FEED_TAGS:
+                    feed_title = (elem.text or "").strip()
+    except etree.XMLSyntaxError:
+        return None
+
+    if not entries:
+        return None
+    return feedparser.FeedParserDict(entries=entries, feed=feedparser.FeedParserDict(title=feed_title))
+
+
+_FEED_TOKENS = ("rss", "feed", "atom")
+_FEED_TYPE_TOKENS = ("rss", "xml", "atom")
+
+
+def _contains_any_xpath(attr: str, tokens: Iterable[str]) -> str:
+    """XPath predicate: lowercased `attr` contains any of `tokens`."""
+    lowered = f'translate({attr}, "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")'
+    return " or ".join(f'contains({lowered}, "{tok}")' for tok in tokens)
+
+
+_ALTERNATE_FEED_XPATH = etree.XPath(
+    f'//link[contains(@rel, "alternate") and ({_contains_any_xpath("@type", _FEED_TYPE_TOKENS)})]/@href'
+)
+_FEED_ANCHOR_XPATH = etree.XPath(f"//a[{_contains_any_xpath('@href', _FEED_TOKENS)}]/@href")
+
+
 def _resolve_feed_url_from_html(base_url: str, html_content: bytes) -> Optional[str]:
     """Inspect `html_content` for feed links and return the first resolved URL.
 
@@ -71,156 +386,192 @@ def _resolve_feed_url_from_html(base_url: str, html_content: bytes) -> Optional[
     heuristically for anchors containing 'rss' or 'feed' in their href.
     """
     try:
-        soup = BeautifulSoup(html_content, "lxml")
-    except Exception:
-        soup = BeautifulSoup(html_content, "html.parser")
-
-    # Look for <link rel="alternate" ...>
-    for link in soup.find_all("link", rel=True):
-        rel = link.get("rel")
-        # rel may be a list
-        if isinstance(rel, (list, tuple)):
-            rel = " ".join(rel)
-        if "alternate" in (rel or ""):
-            ltype = (link.get("type") or "").lower()
-            if "rss" in ltype or "xml" in ltype or "atom" in ltype:
-                href = link.get("href")
-                if href:
-                    return urljoin(base_url, href)
-
-    # Heuristic: look for <a href> containing rss/feed/atom
-    candidates = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if any(tok in href.lower() for tok in ("rss", "feed", "atom")):
-            candidates.append(urljoin(base_url, href))
-
-    return candidates[0] if candidates else None
+        doc = lxml.html.fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        # Empty or undecodable document
+        return None
+
+    hrefs = _ALTERNATE_FEED_XPATH(doc) or _FEED_ANCHOR_XPATH(doc)
+    return urljoin(base_url, hrefs[0]) if hrefs else None
 
 
 def _fetch_article_content(url: str, timeout: int = 8) -> tuple[str | None, list[str]]:
     """Fetch an article page and attempt to extract the main text and authors.
 
     Returns (text, authors). Either may be empty/None on failure.
-    Uses simple heuristics: <article> tag, role="main", or the largest
-    block of consecutive <p> elements.
+    Uses simple heuristics: <article> tag, role="main", or all <p>
+    elements joined together.
     """
-    import requests
+    content, _ = get_cached(url, timeout=timeout)
 
-    headers = {"User-Agent": "ai-news-aggregator/1.0 (+https://example.local)"}
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    resp.raise_for_status()
+    return get_parse_pool().submit(_extract_article, content).result()
+
+
+_AUTHOR_META_PROPERTIES = ("article:author", "og:article:author", "og:author")
+_BYLINE_CLASSES = ("byline__name", "author", "byline")
 
+
+def _node_text(el: Any, separator: str = " ") -> str:
+    """Join the stripped text nodes under `el`, like bs4's `get_text(separator, strip=True)`."""
+    return separator.join(t for t in (s.strip() for s in el.itertext()) if t)
+
+
+def _extract_article(html: bytes) -> tuple[str | None, list[str]]:
+    """Extract (text, authors) from an article page in a single DOM walk.
+
+    Every candidate (article/main containers, author meta tags, rel=author,
+    byline classes, paragraphs) is collected during one pass over the tree
+    and the winners are picked afterwards.
+    """
     try:
-        soup = BeautifulSoup(resp.content, "lxml")
-    except Exception:
-        soup = BeautifulSoup(resp.content, "html.parser")
+        root = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None, []
 
     # remove script/style
-    for s in soup(["script", "style", "noscript"]):
-        s.extract()
-
-    # Try to find an article tag first
-    article = soup.find("article")
-    if article:
-        text = article.get_text(separator=" ", strip=True)
+    etree.strip_elements(root, "script", "style", "noscript", with_tail=False)
+
+    article = role_main = id_main = rel_author = byline_id = None
+    meta_name_author = None
+    meta_props: Dict[str, str] = {}
+    bylines: Dict[str, Any] = {}
+    paragraphs = []
+
+    for el in root.iter():
+        tag = el.tag
+        if not isinstance(tag, str):
+            # comments / processing instructions
+            continue
+        if tag == "p":
+            paragraphs.append(el)
+        elif tag == "article":
+            if article is None:
+                article = el
+        elif tag == "meta":
+            content = el.get("content")
+            if content:
+                if el.get("name") == "author":
+                    if meta_name_author is None:
+                        meta_name_author = content.strip()
+                else:
+                    prop = el.get("property")
+                    if prop in _AUTHOR_META_PROPERTIES and prop not in meta_props:
+                        meta_props[prop] = content.strip()
+
+        if role_main is None and el.get("role") == "main":
+            role_main = el
+        el_id = el.get("id")
+        if el_id == "main" and id_main is None:
+            id_main = el
+        elif el_id == "byline" and byline_id is None:
+            byline_id = el
+        if rel_author is None and "author" in (el.get("rel") or "").split():
+            rel_author = el
+        classes = el.get("class")
+        if classes:
+            for cls in classes.split():
+                if cls in _BYLINE_CLASSES and cls not in bylines:
+                    bylines[cls] = el
+
+    # Try an article tag first, then role="main" / id="main", else all <p>
+    main = article if article is not None else (role_main if role_main is not None else id_main)
+    if main is not None:
+        text = _node_text(main)
     else:
-        # Try role="main"
-        main = soup.find(attrs={"role": "main"}) or soup.find(id="main")
-        if main:
-            text = main.get_text(separator=" ", strip=True)
-        else:
-            # Heuristic: find the longest sequence of <p> text
-            p_blocks = [" ".join(p.get_text(separator=" ", strip=True) for p in block) for block in []]
-            # Simpler: gather all <p> and return the joined text
-            ps = [p.get_text(separator=" ", strip=True) for p in soup.find_all("p")]
-            text = "\n\n".join(ps).strip()
+        text = "\n\n".join(filter(None, (_node_text(p) for p in paragraphs)))
 
-    # Author heuristics: meta tags or common class names
+    # Author heuristics: meta tags, rel=author, then common class/id selectors
     authors: list[str] = []
-    # meta name=author
-    ma = soup.find("meta", attrs={"name": "author"})
-    if ma and ma.get("content"):
-        authors.append(ma.get("content").strip())
-
-    # meta property article:author or og:article:author
-    for prop in ("article:author", "og:article:author", "og:author"):
-        tag = soup.find("meta", attrs={"property": prop})
-        if tag and tag.get("content"):
-            authors.append(tag.get("content").strip())
-
-    # rel=author
-    rel = soup.find(attrs={"rel": "author"})
-    if rel and rel.get_text(strip=True):
-        authors.append(rel.get_text(strip=True))
-
-    # common class/id selectors (best-effort)
+    if meta_name_author:
+        authors.append(meta_name_author)
+    authors.extend(meta_props[prop] for prop in _AUTHOR_META_PROPERTIES if prop in meta_props)
+    if rel_author is not None and _node_text(rel_author, ""):
+        authors.append(_node_text(rel_author, ""))
     if not authors:
-        selectors = [".byline__name", ".author", ".byline", "#byline"]
-        for sel in selectors:
-            node = soup.select_one(sel)
-            if node and node.get_text(strip=True):
-                authors.append(node.get_text(strip=True))
+        candidates = [bylines.get(cls) for cls in _BYLINE_CLASSES] + [byline_id]
+        for node in candidates:
+            if node is not None and _node_text(node, ""):
+                authors.append(_node_text(node, ""))
                 break
 
-    # Deduplicate authors
-    authors = [a for i, a in enumerate(authors) if a and a not in authors[:i]]
+    # Deduplicate authors, keeping first-seen order
+    authors = list(dict.fromkeys(a for a in authors if a))
 
     return (text if text else None, authors)
 
 
-def parse_entries(entries: Iterable[Any], feed_title: Optional[str] = None) -> List[Dict[str, Any]]:
+def _html_to_text(html: str) -> str:
+    """Return the visible text of an HTML fragment."""
+    if not html:
+        return ""
+    tree = LexborHTMLParser(html)
+    # feedparser no longer sanitizes, so drop non-visible text here
+    tree.strip_tags(["script", "style"])
+    root = tree.root
+    return root.text(separator=" ", strip=True) if root is not None else ""
+
+
+def parse_entries(
+    entries: Iterable[Any],
+    feed_title: Optional[str] = None,
+    fetch_articles: bool = True,
+    cutoff: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
     """Normalize feed entries into a list of dicts.
 
-    - Skips entries without a published date.
+    - Skips entries without a published date, and entries published before
+      `cutoff` if given (their HTML is never parsed, nor their page fetched).
     - Converts dates to ISO-8601 UTC strings.
-    - Cleans HTML from summaries/content using BeautifulSoup.
+    - Cleans HTML from summaries/content (selectolax).
+    - Unless `fetch_articles` is False, fetches the article page of entries
+      without content (see `fill_article_content`).
     """
     out: List[Dict[str, Any]] = []
     now = datetime.now(timezone.utc)
 
     for e in entries:
-        published_dt = None
-        if hasattr(e, "published_parsed") and e.published_parsed:
-            published_dt = _struct_time_to_dt(e.published_parsed)
-        elif hasattr(e, "updated_parsed") and e.updated_parsed:
-            published_dt = _struct_time_to_dt(e.updated_parsed)
-
         # Ignore entries without a reliable published/updated timestamp
-        if not published_dt:
+        published_dt = _entry_datetime(e)
+        if published_dt is None:
+            continue
+        if cutoff is not None and published_dt < cutoff:
             continue
 
         # Extract text from summary/content
-        summary_html = getattr(e, "summary", None) or ""
-        content_text = ""
-        if hasattr(e, "content") and e.content:
+        summary_html = e.get("summary") or ""
+        content_html = content_text = ""
+        content = e.get("content")
+        if content:
             # feedparser content is a list of dicts with 'value'
-            first = e.content[0]
+            first = content[0]
             content_html = first.get("value") if isinstance(first, dict) else str(first)
-            content_text = BeautifulSoup(content_html, "lxml").get_text(separator=" ", strip=True)
+            content_text = _html_to_text(content_html)
 
-        summary_text = BeautifulSoup(summary_html, "lxml").get_text(separator=" ", strip=True)
+        # Many feeds repeat the content as the summary; don't parse it twice
+        summary_text = content_text if content_text and summary_html == content_html else _html_to_text(summary_html)
 
         authors = []
-        if hasattr(e, "author") and e.author:
-            authors = [e.author]
-        elif hasattr(e, "authors") and e.authors:
+        author = e.get("author")
+        if author:
+            authors = [author]
+        elif e.get("authors"):
             try:
-                authors = [a.name for a in e.authors if getattr(a, "name", None)]
+                authors = [a["name"] for a in e["authors"] if a.get("name")]
             except Exception:
-                authors = [str(a) for a in e.authors]
+                authors = [str(a) for a in e["authors"]]
 
         tags = []
-        if hasattr(e, "tags") and e.tags:
+        if e.get("tags"):
             try:
-                tags = [t.term for t in e.tags if getattr(t, "term", None)]
+                tags = list(dict.fromkeys(t["term"] for t in e["tags"] if t.get("term")))
             except Exception:
-                tags = [str(t) for t in e.tags]
+                tags = list(dict.fromkeys(str(t) for t in e["tags"]))
 
+        link = e.get("link")
         normalized: Dict[str, Any] = {
-            "id": getattr(e, "id", getattr(e, "guid", None) or getattr(e, "link", None)),
-            "title": getattr(e, "title", ""),
-            "link": getattr(e, "link", None),
+            "id": e.get("id", e.get("guid") or link),
+            "title": e.get("title", ""),
+            "link": link,
             "published": published_dt.isoformat(),
             "summary": summary_text,
             "content": content_text,
@@ -229,36 +580,171 @@ def parse_entries(entries: Iterable[Any], feed_title: Optional[str] = None) -> L
             "source": feed_title,
             "fetched_at": now.isoformat(),
         }
-        # If no content found in the feed entry, try to fetch the article page
-        if not content_text and normalized.get("link"):
-            try:
-                article_text, page_authors = _fetch_article_content(normalized["link"])
-                if article_text:
-                    normalized["content"] = article_text
-                if not authors and page_authors:
-                    normalized["authors"] = page_authors
-            except Exception:
-                # If article fetch fails, continue without raising
-                pass
-
         out.append(normalized)
 
+    if fetch_articles:
+        fill_article_content(out)
     return out
 
 
-def fetch_recent(url: str, hours: int = 24, timeout: int = 10) -> List[Dict[str, Any]]:
+def fill_article_content(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fetch the article page of items without content and fill it in place.
+
+    Items whose summary is already `MIN_CONTENT_LEN` characters or longer,
+    or whose link is on a `$INGEST_SKIP_ARTICLE_FETCH_HOSTS` host, are left
+    alone. Pages are fetched concurrently and merged back in item order.
+    Returns `items` for convenience.
+    """
+    pending = [
+        n
+        for n in items
+        if not n["content"]
+        and len(n["summary"]) < MIN_CONTENT_LEN
+        and n.get("link")
+        and not _skip_article_host(n["link"])
+    ]
+    for normalized, (article_text, page_authors) in zip(
+        pending, _ARTICLE_POOL.map(_try_fetch_article_content, [n["link"] for n in pending])
+    ):
+        if article_text:
+            normalized["content"] = article_text
+        if not normalized["authors"] and page_authors:
+            normalized["authors"] = page_authors
+
+    return items
+
+
+def _skip_article_host(url: str) -> bool:
+    if not _SKIP_ARTICLE_FETCH_HOSTS:
+        return False
+    host = (urlsplit(url).hostname or "").lower()
+    while host:
+        if host in _SKIP_ARTICLE_FETCH_HOSTS:
+            return True
+        host = host.partition(".")[2]
+    return False
+
+
+def _try_fetch_article_content(url: str) -> tuple[str | None, list[str]]:
+    """Like `_fetch_article_content` but returns (None, []) instead of raising."""
+    try:
+        return _fetch_article_content(url)
+    except Exception:
+        # If article fetch fails, continue without raising
+        return None, []
+
+
+def fetch_recent(
+    url: str, hours: int = 24, timeout: int = 10, cache: Optional[MutableMapping[str, Any]] = None
+) -> List[Dict[str, Any]]:
     """Fetch `url` and return normalized entries published in the last `hours` hours.
 
     If the feed is unavailable an exception from `requests` will be raised.
     Caller can catch exceptions and treat them as "not available".
+
+    `cache` (any mapping, e.g. `backend.app.cache.items.get_cache()`) keeps
+    a `CachedFeed` per URL: the items of the last fetch and the validators
+    of the response they came from. Requests are only conditional for URLs
+    already in it, and an unchanged feed then returns its cached items
+    (still filtered to the window). A window wider than the one the cached
+    items were cut to is fetched unconditionally. Without a cache every fetch is
+    unconditional, so a feed never comes back empty just because an
+    earlier run saw it.
+    """
+    previous = _cached_feed(cache, url, hours)
+    feed = fetch_feed(url, timeout=timeout, previous=previous)
+    if feed.get("unchanged"):
+        return _cached_recent(previous, hours)
+    items = recent_entries(feed, hours=hours)
+    if cache is not None:
+        cache[url] = CachedFeed(feed["feed_url"], feed["validators"], items, hours)
+    return items
+
+
+async def fetch_recent_async(
+    client: httpx.AsyncClient,
+    url: str,
+    hours: int = 24,
+    timeout: int = 10,
+    slots: Optional[Dict[str, asyncio.Semaphore]] = None,
+    cache: Optional[MutableMapping[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Async `fetch_recent` over a shared `httpx.AsyncClient`.
+
+    Downloads stay on the event loop, XML/HTML parsing runs in the process
+    pool, and article pages are fetched by the article thread pool. If the
+    URL is an HTML page advertising a feed, that feed is fetched instead.
+    `cache` behaves as in `fetch_recent`. Raises `httpx.HTTPError` when
+    the feed is unavailable.
     """
-    feed = fetch_feed(url, timeout=timeout)
+    loop = asyncio.get_running_loop()
+    pool = get_parse_pool()
+    previous = _cached_feed(cache, url, hours)
+
+    fetched = await _afetch_if_changed(client, url, timeout, slots, previous)
+    if fetched is None:
+        return _cached_recent(previous, hours)
+    body, headers = fetched
+    items, alternate = await loop.run_in_executor(pool, parse_feed_bytes, url, body, headers.get("content-type", ""), hours)
+
+    feed_url = url
+    if alternate:
+        # The page advertised an alternate feed: fetch and parse that instead
+        feed = await _afetch_if_changed(client, alternate, timeout, slots, previous)
+        if feed is None:
+            return _cached_recent(previous, hours)
+        feed_url, (body, headers) = alternate, feed
+        items, _ = await loop.run_in_executor(pool, parse_feed_bytes, feed_url, body, "xml", hours)
+
+    items = await loop.run_in_executor(None, fill_article_content, items)
+    if cache is not None:
+        cache[url] = CachedFeed(feed_url, response_validators(headers, body), items, hours)
+    return items
+
+
+async def _afetch_if_changed(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: int,
+    slots: Optional[Dict[str, asyncio.Semaphore]],
+    previous: Optional[CachedFeed] = None,
+) -> Optional[tuple[bytes, httpx.Headers]]:
+    """GET a feed URL, conditional on `previous`; returns None if it did not change since then."""
+    try:
+        _, body, headers = await afetch(client, url, timeout, headers=conditional_headers(previous, url), slots=slots)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code != 304:
+            raise
+        return None
+    return None if is_unchanged(previous, url, body) else (body, headers)
+
+
+def _cached_feed(cache: Optional[MutableMapping[str, Any]], url: str, hours: int) -> Optional[CachedFeed]:
+    """The cached record for `url`, if its items cover the last `hours` hours."""
+    entry = cache.get(url) if cache is not None else None
+    # Entries written before validators moved into the items cache were bare item lists
+    if not isinstance(entry, CachedFeed) or entry.hours < hours:
+        return None
+    return entry
+
+
+def _cached_recent(previous: Optional[CachedFeed], hours: int) -> List[Dict[str, Any]]:
+    """The items of an unchanged feed's cached record that are still inside the window."""
+    if previous is None or not previous.items:
+        return []
+    # parse_entries always emits whole-second UTC isoformat() strings, which
+    # sort chronologically, so compare them as strings instead of reparsing
+    cutoff = _cutoff(hours).replace(microsecond=0).isoformat()
+    return [item for item in previous.items if item["published"] >= cutoff]
+
+
+def recent_entries(feed: feedparser.FeedParserDict, hours: int = 24) -> List[Dict[str, Any]]:
+    """Normalize the entries of a parsed `feed` and keep the last `hours` hours."""
     feed_title = feed.feed.get("title") if getattr(feed, "feed", None) else None
 
     entries = feed.entries if hasattr(feed, "entries") else []
-    normalized = parse_entries(entries, feed_title=feed_title)
+    return parse_entries(entries, feed_title=feed_title, cutoff=_cutoff(hours))
 
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    recent = [e for e in normalized if datetime.fromisoformat(e["published"]) >= cutoff]
-    return recent
 
+def _cutoff(hours: int) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(hours=hours)
@@ -7,52 +7,41 @@ from __future__ import annotations
 
 from typing import Optional
 
+from selectolax.lexbor import LexborHTMLParser
+
+from backend.app.ingest._http import decode, get_cached
+
 
 def fetch_html(url: str, timeout: int = 10) -> str:
     """Fetch the HTML for `url` and return it as text.
 
-    Raises the underlying `requests` exceptions on network errors.
+    Pages are served from the on-disk body cache when fresh. Raises the
+    underlying `requests` exceptions on network errors.
     """
-    import requests
-
-    headers = {"User-Agent": "ai-news-aggregator/1.0 (+https://example.local)"}
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    resp.raise_for_status()
-    return resp.text
+    body, encoding = get_cached(url, timeout=timeout)
+    return decode(body, encoding)
 
 
-def extract_text(html: str) -> Optional[str]:
+def extract_text(html: str | bytes) -> Optional[str]:
     """Extract main article text from `html` using simple heuristics.
 
     Returns extracted text or `None` if nothing useful was found.
     """
-    from bs4 import BeautifulSoup
-
-    try:
-        soup = BeautifulSoup(html, "lxml")
-    except Exception:
-        soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
 
     # Remove scripts/styles
-    for s in soup(["script", "style", "noscript"]):
-        s.extract()
-
-    # Prefer <article>
-    article = soup.find("article")
-    if article:
-        text = article.get_text(separator=" ", strip=True)
-        if text:
-            return text
-
-    # Try role=main or id=main
-    main = soup.find(attrs={"role": "main"}) or soup.find(id="main")
-    if main:
-        text = main.get_text(separator=" ", strip=True)
-        if text:
-            return text
+    tree.strip_tags(["script", "style", "noscript"])
+
+    # Prefer <article>, then role=main or id=main
+    for sel in ("article", '[role="main"]', '[id="main"]'):
+        node = tree.css_first(sel)
+        if node:
+            text = node.text(separator=" ", strip=True)
+            if text:
+                return text
 
     # Fallback: join all <p> elements (common heuristic)
-    ps = [p.get_text(separator=" ", strip=True) for p in soup.find_all("p")]
+    ps = [p.text(separator=" ", strip=True) for p in tree.css("p")]
     if ps:
         joined = "\n\n".join(ps).strip()
         return joined or None
@@ -12,12 +12,22 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
+import asyncio
 import re
-import json
 from typing import Iterable
 
+import httpx
+from bs4 import BeautifulSoup
+
+from backend.app.core import jsonio
 from backend.app.ingest import rss
 from backend.app.ingest import scraper
+from backend.app.ingest._http import afetch, async_client, get_limited
+
+
+_REDDIT_SUB_RE = re.compile(r"reddit\.com/r/([^/]+)/?")
+_REDDIT_HOSTS = ("reddit.com", "redd.it")
+_X_HOSTS = ("twitter.com", "x.com")
 
 
 def _now_iso() -> str:
@@ -29,14 +39,16 @@ def fetch_reddit_subreddit(subreddit: str, limit: int = 25, timeout: int = 10) -
 
     Example: `subreddit='news'` will fetch from `https://www.reddit.com/r/news/new.json`.
     """
-    import requests
-
     url = f"https://www.reddit.com/r/{subreddit}/new.json?limit={limit}"
-    headers = {"User-Agent": "ai-news-aggregator (+https://example.local)"}
-    resp = requests.get(url, headers=headers, timeout=timeout)
+    resp = get_limited(url, timeout=timeout)
     resp.raise_for_status()
-    data = resp.json()
+    data = jsonio.loads(resp.content)
+
+    return _normalize_reddit_listing(data, subreddit)
+
 
+def _normalize_reddit_listing(data: Dict[str, Any], subreddit: str) -> List[Dict[str, Any]]:
+    """Normalize a decoded subreddit listing into a list of items."""
     out: List[Dict[str, Any]] = []
     for child in data.get("data", {}).get("children", []):
         d = child.get("data", {})
@@ -57,10 +69,8 @@ def fetch_reddit_subreddit(subreddit: str, limit: int = 25, timeout: int = 10) -
         # If no selftext and the post is a link, attempt to fetch linked page text
         if not item["content"] and d.get("url"):
             try:
-                from backend.app.ingest.scraper import fetch_html, extract_text
-
-                html = fetch_html(d.get("url"), timeout=5)
-                text = extract_text(html) or ""
+                html = scraper.fetch_html(d.get("url"), timeout=5)
+                text = scraper.extract_text(html) or ""
                 if text:
                     item["content"] = text
             except Exception:
@@ -71,27 +81,34 @@ def fetch_reddit_subreddit(subreddit: str, limit: int = 25, timeout: int = 10) -
     return out
 
 
+def _reddit_post_json_url(post_url: str) -> str:
+    if not post_url.endswith(".json"):
+        if post_url.endswith("/"):
+            post_url = post_url[:-1]
+        post_url = post_url + ".json"
+    return post_url
+
+
 def fetch_reddit_post(post_url: str, timeout: int = 8) -> List[Dict[str, Any]]:
     """Fetch a single Reddit post given its URL and return a list with one normalized item.
 
     The function will request the JSON form of the post (`.json`) and normalize the first
     post it finds. Returns an empty list on failure.
     """
-    import requests
-
-    if not post_url.endswith(".json"):
-        if post_url.endswith("/"):
-            post_url = post_url[:-1]
-        post_url = post_url + ".json"
+    post_url = _reddit_post_json_url(post_url)
 
-    headers = {"User-Agent": "ai-news-aggregator (+https://example.local)"}
     try:
-        resp = requests.get(post_url, headers=headers, timeout=timeout)
+        resp = get_limited(post_url, timeout=timeout)
         resp.raise_for_status()
-        data = resp.json()
+        data = jsonio.loads(resp.content)
     except Exception:
         return []
 
+    return _normalize_reddit_post(data)
+
+
+def _normalize_reddit_post(data: Any) -> List[Dict[str, Any]]:
+    """Normalize a decoded Reddit post payload; returns an empty list on failure."""
     out: List[Dict[str, Any]] = []
     try:
         # Reddit post JSON can be a list where the first element contains post data
@@ -126,10 +143,8 @@ def fetch_reddit_post(post_url: str, timeout: int = 8) -> List[Dict[str, Any]]:
         # Try to fetch linked page text if no selftext
         if not item["content"] and post_data.get("url"):
             try:
-                from backend.app.ingest.scraper import fetch_html, extract_text
-
-                html = fetch_html(post_data.get("url"), timeout=5)
-                text = extract_text(html) or ""
+                html = scraper.fetch_html(post_data.get("url"), timeout=5)
+                text = scraper.extract_text(html) or ""
                 if text:
                     item["content"] = text
             except Exception:
@@ -142,20 +157,23 @@ def fetch_reddit_post(post_url: str, timeout: int = 8) -> List[Dict[str, Any]]:
     return out
 
 
+_OEMBED_URL = "https://publish.twitter.com/oembed"
+
+
 def fetch_x_oembed(tweet_url: str, timeout: int = 8) -> Optional[Dict[str, Any]]:
     """Fetch tweet info using Twitter's publish oEmbed endpoint.
 
     Returns a normalized dict or None on failure.
     """
-    import requests
-    from bs4 import BeautifulSoup
-
-    oembed_url = "https://publish.twitter.com/oembed"
-    headers = {"User-Agent": "ai-news-aggregator (+https://example.local)"}
-    resp = requests.get(oembed_url, params={"url": tweet_url}, headers=headers, timeout=timeout)
+    resp = get_limited(_OEMBED_URL, params={"url": tweet_url}, timeout=timeout)
     resp.raise_for_status()
-    data = resp.json()
+    data = jsonio.loads(resp.content)
+
+    return _normalize_x_oembed(data, tweet_url)
+
 
+def _normalize_x_oembed(data: Dict[str, Any], tweet_url: str) -> Dict[str, Any]:
+    """Normalize a decoded oEmbed payload for `tweet_url`."""
     html = data.get("html", "")
     author_name = data.get("author_name")
     author_url = data.get("author_url")
@@ -200,8 +218,7 @@ def process_url_list(urls: Iterable[str], out: str = "recent.json", hours: int =
     fall back to RSS resolution and finally raw HTML extraction.
     """
     items = collect_from_urls(urls, hours=hours, timeout=timeout)
-    with open(out, "w", encoding="utf-8") as fh:
-        json.dump(items, fh, ensure_ascii=False, indent=2)
+    jsonio.write_bytes(out, jsonio.dumps(items))
 
     print(f"Wrote {len(items)} total entries to {out}")
     return len(items)
@@ -211,76 +228,105 @@ def collect_from_urls(urls: Iterable[str], hours: int = 24, timeout: int = 10) -
     """Collect normalized items from a list of URLs and return the combined list.
 
     This is the programmatic core used by `process_url_list` and callers that
-    want the items in-memory instead of writing to disk.
+    want the items in-memory instead of writing to disk. All URLs are fetched
+    concurrently; items are returned in the order of `urls`.
     """
-    combined: List[Dict[str, Any]] = []
-    urls = list(urls)
+    return [item for items in collect_by_url(urls, hours=hours, timeout=timeout) for item in items]
+
+
+def collect_by_url(urls: Iterable[str], hours: int = 24, timeout: int = 10) -> List[List[Dict[str, Any]]]:
+    """Like `collect_from_urls`, but return one list of items per URL, in the order of `urls`.
+
+    Lets callers attribute items to the URL they came from without a
+    separate fetch per group of URLs.
+    """
+    return asyncio.run(_acollect(list(urls), hours=hours, timeout=timeout))
+
+
+async def _acollect(urls: List[str], hours: int = 24, timeout: int = 10) -> List[List[Dict[str, Any]]]:
     total = len(urls)
     print(f"Processing {total} source(s)...")
-    for idx, url in enumerate(urls, start=1):
-        print(f"[{idx}/{total}] {url}")
-        try:
-            items: List[Dict[str, Any]] = []
-            lower = url.lower()
-
-            # Reddit subreddit vs post
-            if "reddit.com" in lower or "redd.it" in lower or lower.startswith("r/"):
-                if "/comments/" in lower:
-                    try:
-                        res = fetch_reddit_post(url, timeout=timeout)
-                    except NameError:
-                        res = []
-                    if isinstance(res, dict):
-                        items = [res]
-                    else:
-                        items = list(res or [])
-                else:
-                    m = re.search(r"reddit\.com/r/([^/]+)/?", lower)
-                    if m:
-                        subreddit = m.group(1)
-                        try:
-                            items = fetch_reddit_subreddit(subreddit, limit=25, timeout=timeout)
-                        except TypeError:
-                            items = fetch_reddit_subreddit(subreddit, limit=25)
-
-            # Twitter / X single status
-            elif "twitter.com" in lower or "x.com" in lower:
-                try:
-                    item = fetch_x_status(url, timeout=timeout)
-                    if item:
-                        items = [item]
-                except Exception as e:
-                    print(f"  failed x/twitter: {e}")
+    results: List[List[Dict[str, Any]]] = [[] for _ in urls]
+    slots: Dict[str, asyncio.Semaphore] = {}
+    async with async_client() as client:
+        async with asyncio.TaskGroup() as tg:
+            for idx, url in enumerate(urls):
+                tg.create_task(_acollect_one(client, slots, idx, url, results, hours, timeout))
+
+    return results
+
+
+async def _acollect_one(
+    client: httpx.AsyncClient,
+    slots: Dict[str, asyncio.Semaphore],
+    idx: int,
+    url: str,
+    results: List[List[Dict[str, Any]]],
+    hours: int,
+    timeout: int,
+) -> None:
+    """Fetch and normalize a single URL, storing its items at `results[idx]`.
+
+    Never raises, so one failing source cannot cancel its siblings in the
+    task group.
+    """
+    loop = asyncio.get_running_loop()
+    prefix = f"[{idx + 1}/{len(results)}] {url}"
+    try:
+        items: List[Dict[str, Any]] = []
+        lower = url.lower()
 
-            else:
-                # Fallback: try RSS/Atom resolution
+        # Reddit subreddit vs post
+        if any(h in lower for h in _REDDIT_HOSTS) or lower.startswith("r/"):
+            if "/comments/" in lower:
                 try:
-                    items = rss.fetch_recent(url, hours=hours, timeout=timeout)
+                    _, body, _ = await afetch(client, _reddit_post_json_url(url), timeout, slots=slots)
+                    items = await loop.run_in_executor(None, _normalize_reddit_post, jsonio.loads(body))
                 except Exception:
-                    # As a last resort, fetch the html and extract text
-                    try:
-                        html = scraper.fetch_html(url, timeout=timeout)
-                        text = scraper.extract_text(html)
-                        if text:
-                            now = datetime.now(timezone.utc).isoformat()
-                            items = [{
-                                "id": url,
-                                "title": None,
-                                "link": url,
-                                "published": now,
-                                "summary": None,
-                                "content": text,
-                                "authors": [],
-                                "tags": [],
-                                "source": url,
-                                "fetched_at": now,
-                            }]
-                    except Exception as e:
-                        print(f"  fallback failed: {e}")
-
-            combined.extend(items or [])
-            print(f"  fetched {len(items or [])} items")
-        except Exception as e:
-            print(f"  skipped {url}: {e}")
-
-    return combined
+                    items = []
+            else:
+                m = _REDDIT_SUB_RE.search(lower)
+                if m:
+                    subreddit = m.group(1)
+                    listing_url = f"https://www.reddit.com/r/{subreddit}/new.json?limit=25"
+                    _, body, _ = await afetch(client, listing_url, timeout, slots=slots)
+                    items = await loop.run_in_executor(None, _normalize_reddit_listing, jsonio.loads(body), subreddit)
+
+        # Twitter / X single status
+        elif any(h in lower for h in _X_HOSTS):
+            try:
+                _, body, _ = await afetch(client, _OEMBED_URL, timeout, params={"url": url}, slots=slots)
+                items = [await loop.run_in_executor(None, _normalize_x_oembed, jsonio.loads(body), url)]
+            except Exception as e:
+                print(f"  failed x/twitter for {url}: {e}")
+
+        else:
+            # Fallback: try RSS/Atom resolution
+            try:
+                items = await rss.fetch_recent_async(client, url, hours, timeout, slots)
+            except Exception:
+                # As a last resort, extract text from the html page
+                try:
+                    _, body, _ = await afetch(client, url, timeout, slots=slots)
+                    text = await loop.run_in_executor(rss.get_parse_pool(), scraper.extract_text, body)
+                    if text:
+                        now = datetime.now(timezone.utc).isoformat()
+                        items = [{
+                            "id": url,
+                            "title": None,
+                            "link": url,
+                            "published": now,
+                            "summary": None,
+                            "content": text,
+                            "authors": [],
+                            "tags": [],
+                            "source": url,
+                            "fetched_at": now,
+                        }]
+                except Exception as e:
+                    print(f"  fallback failed for {url}: {e}")
+
+        results[idx] = items or []
+        print(f"{prefix}\n  fetched {len(items or [])} items")
+    except Exception as e:
+        print(f"{prefix}\n  skipped {url}: {e}")
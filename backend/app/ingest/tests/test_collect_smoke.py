@@ -0,0 +1,65 @@
+"""Smoke tests for the multi-source collection helpers without network access."""
+from __future__ import annotations
+
+import asyncio
+import signal
+
+import pytest
+
+from backend.app.cache import seen as seen_module
+from backend.app.cache.seen import SeenSet
+from backend.app.ingest import rss, social
+from scripts import url_links
+
+
+def test_run_default_only_marks_items_seen_once_written(tmp_path, monkeypatch):
+    url = "http://example.com/feed.xml"
+    item = {"id": "item-1", "link": "http://example.com/1", "published": "2026-02-17T10:00:00+00:00"}
+    monkeypatch.setattr(seen_module, "_seen", SeenSet(str(tmp_path / "seen.bin")))
+    monkeypatch.setattr(url_links, "WEB_FEEDS", [url])
+    monkeypatch.setattr(url_links, "REDDIT_COMMUNITIES", [])
+    monkeypatch.setattr(url_links, "_collect", lambda urls, hours, timeout: {url_links._norm(url): [item]})
+
+    with pytest.raises(OSError):
+        url_links.run_default(out=str(tmp_path / "missing" / "out.json"))
+    assert "item-1" not in seen_module.get_seen()
+
+    assert url_links.run_default(out=str(tmp_path / "out.json")) == 1
+    assert url_links.run_default(out=str(tmp_path / "out.json")) == 0
+    assert "item-1" in SeenSet(str(tmp_path / "seen.bin"))
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="no SIGHUP on this platform")
+def test_importing_url_links_leaves_sighup_alone():
+    # A terminal hangup must still terminate `python main.py`
+    assert signal.getsignal(signal.SIGHUP) is signal.SIG_DFL
+
+
+def test_dedup_keeps_the_first_spelling_of_each_url():
+    urls = [
+        "https://Example.com/a/?utm_source=news",
+        "https://example.com/b#comments",
+        "https://example.com/a",
+        "HTTPS://EXAMPLE.COM/b",
+        "https://example.com/c?id=1",
+    ]
+    assert url_links._dedup(urls) == [
+        "https://Example.com/a/?utm_source=news",
+        "https://example.com/b#comments",
+        "https://example.com/c?id=1",
+    ]
+
+
+def test_collect_by_url_keeps_input_order(monkeypatch):
+    urls = [f"http://example.com/feed{i}.xml" for i in range(4)]
+
+    async def fake_fetch_recent_async(client, url, hours, timeout, slots=None, cache=None):
+        # Later URLs finish first, so completion order is the reverse of input order
+        await asyncio.sleep(0.01 * (len(urls) - urls.index(url)))
+        return [{"id": url}] if url != urls[2] else []
+
+    monkeypatch.setattr(rss, "fetch_recent_async", fake_fetch_recent_async)
+    groups = social.collect_by_url(urls)
+
+    assert groups == [[{"id": urls[0]}], [{"id": urls[1]}], [], [{"id": urls[3]}]]
+    assert social.collect_from_urls(urls) == [item for group in groups for item in group]
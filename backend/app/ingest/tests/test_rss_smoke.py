@@ -1,8 +1,14 @@
 """Smoke tests for RSS parsing utilities without network access."""
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
 import feedparser
+import pytest
 
+from backend.app.cache.items import CachedFeed
 from backend.app.ingest import rss
 
 
@@ -23,6 +29,78 @@ SAMPLE_FEED = """<?xml version="1.0" encoding="UTF-8"?>
 </rss>
 """
 
+# feedparser prefers <itunes:summary> / <media:description> over <description>,
+# so those two are only exercised in test_fast_parse_ignores_foreign_namespaces.
+MEDIA_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:media="http://search.yahoo.com/mrss/" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
+     xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel>
+<title>Media Feed</title>
+<item>
+  <itunes:author>Podcast host</itunes:author>
+  <title>Real title</title>
+  <link>http://example.com/m</link>
+  <guid>m1</guid>
+  <pubDate>Tue, 17 Feb 2026 10:00:00 GMT</pubDate>
+  <description>Short summary</description>
+  <content:encoded><![CDATA[<p>Full body text</p>]]></content:encoded>
+  <dc:creator>Jane Doe</dc:creator>
+  <media:title>Media title</media:title>
+  <media:content url="http://example.com/a.jpg"><media:title>Photo credit</media:title><media:text>Image caption</media:text></media:content>
+</item>
+</channel>
+</rss>
+"""
+
+ATOM_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Atom Feed</title>
+<entry>
+  <title>Atom entry</title>
+  <link rel="alternate" href="http://example.com/a"/>
+  <id>urn:a1</id>
+  <published>2026-02-17T09:00:00Z</published>
+  <author><name>Ann Author</name></author>
+  <summary>Atom summary</summary>
+  <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><p>Atom <b>body</b></p></div></content>
+  <source><title>Upstream Feed</title></source>
+</entry>
+</feed>
+"""
+
+# Content-only entries: feedparser fills the summary from the content
+CONTENT_ONLY_RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel>
+<title>Content Feed</title>
+<item>
+  <title>Body only</title>
+  <link>http://example.com/c</link>
+  <guid>c1</guid>
+  <dc:creator>Jane Doe</dc:creator>
+  <pubDate>Tue, 17 Feb 2026 10:00:00 GMT</pubDate>
+  <content:encoded><![CDATA[<p>Full body</p>]]></content:encoded>
+</item>
+</channel>
+</rss>
+"""
+
+CONTENT_ONLY_ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Atom Content Feed</title>
+<entry>
+  <title>Atom body only</title>
+  <link href="http://example.com/ac"/>
+  <id>urn:ac1</id>
+  <author><name>Ann Author</name></author>
+  <published>2026-02-17T09:00:00Z</published>
+  <content type="html">&lt;p&gt;Full body&lt;/p&gt;</content>
+</entry>
+</feed>
+"""
+
 
 def test_parse_entries_basic():
     feed = feedparser.parse(SAMPLE_FEED)
@@ -37,3 +115,198 @@ def test_parse_entries_basic():
     assert item["link"] == "http://example.com/1"
     assert "Hello world" in item["summary"] or "Hello" in item["summary"]
     assert "published" in item
+
+
+def test_parse_entries_cutoff_skips_old_entries():
+    entries = feedparser.parse(SAMPLE_FEED).entries
+    before = datetime(2026, 2, 17, 9, 0, tzinfo=timezone.utc)
+    after = datetime(2026, 2, 17, 11, 0, tzinfo=timezone.utc)
+
+    assert len(rss.parse_entries(entries, fetch_articles=False, cutoff=before)) == 1
+    assert rss.parse_entries(entries, fetch_articles=False, cutoff=after) == []
+
+
+def test_fast_parse_matches_feedparser():
+    fast = rss._fast_parse(SAMPLE_FEED.encode())
+    slow = feedparser.parse(SAMPLE_FEED)
+
+    assert fast.feed.get("title") == slow.feed.get("title") == "Test Feed"
+    assert len(fast.entries) == len(slow.entries) == 1
+    for key in ("title", "link", "id", "summary", "published"):
+        assert fast.entries[0][key] == slow.entries[0][key]
+    fast_item = rss.parse_entries(fast.entries, fetch_articles=False)[0]
+    slow_item = rss.parse_entries(slow.entries, fetch_articles=False)[0]
+    assert fast_item["published"] == slow_item["published"] == "2026-02-17T10:00:00+00:00"
+
+
+def test_unusual_dates_fall_back_to_feedparser():
+    # A W3C-DTF variant the stdlib rejects but feedparser reads
+    feed = SAMPLE_FEED.replace(
+        "<pubDate>Tue, 17 Feb 2026 10:00:00 GMT</pubDate>", "<pubDate>2026-02-17T10:00:00.5 Z</pubDate>"
+    )
+    assert rss._fast_parse(feed.encode()) is None
+    item = rss.parse_entries(rss._parse_bytes(feed.encode()).entries, fetch_articles=False)[0]
+    assert item["published"] == "2026-02-17T10:00:00+00:00"
+
+
+@pytest.mark.parametrize(
+    "feed",
+    [MEDIA_FEED, ATOM_FEED, CONTENT_ONLY_RSS, CONTENT_ONLY_ATOM],
+    ids=["rss-extensions", "atom", "rss-content-only", "atom-content-only"],
+)
+def test_fast_parse_matches_feedparser_on_namespaced_feeds(feed):
+    fast = rss._fast_parse(feed.encode())
+    slow = feedparser.parse(feed)
+
+    assert fast.feed.get("title") == slow.feed.get("title")
+    fast_item = rss.parse_entries(fast.entries, fetch_articles=False)[0]
+    slow_item = rss.parse_entries(slow.entries, fetch_articles=False)[0]
+    for key in ("title", "link", "id", "summary", "content", "published", "authors"):
+        assert fast_item[key] == slow_item[key]
+    assert fast_item["content"] in ("Full body text", "Atom body", "Full body")
+    assert fast_item["summary"]
+    assert fast_item["authors"] in (["Jane Doe"], ["Ann Author"])
+
+
+def test_fast_parse_ignores_foreign_namespaces():
+    feed = MEDIA_FEED.replace(
+        "<media:title>Media title</media:title>",
+        "<media:title>Media title</media:title><media:description>Media description</media:description>"
+        "<itunes:summary>Podcast summary</itunes:summary>",
+    )
+    entry = rss._fast_parse(feed.encode()).entries[0]
+    assert entry["title"] == "Real title"
+    assert entry["summary"] == "Short summary"
+    assert entry["content"][0]["value"] == "<p>Full body text</p>"
+
+
+def test_fast_parse_rejects_non_feeds():
+    assert rss._fast_parse(b"<html><body><p>not a feed</p></body></html>") is None
+    assert rss._fast_parse(b"<rss><channel><item>") is None
+
+
+def test_fast_parse_does_not_resolve_entities(tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("top secret")
+    feed = SAMPLE_FEED.replace(
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<?xml version="1.0" encoding="UTF-8"?><!DOCTYPE rss [<!ENTITY x SYSTEM "file://{secret}">]>',
+    ).replace("<title>Item One</title>", "<title>&x;</title>")
+
+    # The fast path refuses the external entity; feedparser does not expand it either
+    assert rss._fast_parse(feed.encode()) is None
+    parsed = rss._parse_bytes(feed.encode())
+    assert all("top secret" not in e.get("title", "") for e in parsed.entries)
+
+
+def test_fast_parse_expands_internal_entities():
+    feed = SAMPLE_FEED.replace(
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<?xml version="1.0" encoding="UTF-8"?><!DOCTYPE rss [<!ENTITY nbsp "&#160;">]>',
+    ).replace("<title>Item One</title>", "<title>Breaking&nbsp;news about X</title>")
+
+    fast = rss._fast_parse(feed.encode())
+    assert fast.entries[0]["title"] == feedparser.parse(feed).entries[0]["title"] == "Breaking\xa0news about X"
+
+
+def test_dtd_entities_fall_back_to_feedparser():
+    # RSS 0.91 documents use the Netscape DTD's entities, which are never fetched
+    feed = SAMPLE_FEED.replace(
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<?xml version="1.0" encoding="UTF-8"?><!DOCTYPE rss PUBLIC "-//Netscape Communications//DTD RSS 0.91//EN"'
+        ' "http://my.netscape.com/publish/formats/rss-0.91.dtd">',
+    ).replace("<title>Item One</title>", "<title>Caf&eacute; opens</title>")
+
+    assert rss._fast_parse(feed.encode()) is None
+    assert rss._parse_bytes(feed.encode()).entries[0]["title"] == feedparser.parse(feed).entries[0]["title"]
+
+
+def test_conditional_headers_and_unchanged_body():
+    url = "http://example.com/feed.xml"
+    assert rss.conditional_headers(None, url) == {}
+
+    headers = {"etag": '"abc"', "last-modified": "Tue, 17 Feb 2026 10:00:00 GMT"}
+    first = rss.parse_feed_response(url, SAMPLE_FEED.encode(), headers)
+    assert len(first.entries) == 1
+    previous = CachedFeed(first["feed_url"], first["validators"], [])
+
+    assert rss.conditional_headers(previous, url) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 17 Feb 2026 10:00:00 GMT",
+    }
+    # Validators only apply to the URL the cached items were parsed from
+    assert rss.conditional_headers(previous, "http://example.com/other.xml") == {}
+
+    # A server that ignores validators and resends the same body yields nothing new
+    assert rss.parse_feed_response(url, SAMPLE_FEED.encode(), headers, previous=previous).entries == []
+
+
+def test_fetch_recent_is_only_conditional_with_a_cache(monkeypatch):
+    monkeypatch.setattr(rss, "_try_fetch_article_content", lambda url: (None, []))
+    feed = {"body": SAMPLE_FEED}
+    sent = []
+
+    def fake_get(url, headers=None, **kwargs):
+        # A server that ignores validators and always resends its current feed
+        sent.append(headers or {})
+        return SimpleNamespace(
+            status_code=200,
+            content=feed["body"].encode(),
+            headers={"etag": '"abc"', "content-type": "application/rss+xml"},
+            raise_for_status=lambda: None,
+        )
+
+    monkeypatch.setattr(rss, "get_limited", fake_get)
+    url = "http://example.com/feed.xml"
+    hours = 24 * 365 * 100
+
+    # Without a cache, repeated fetches are unconditional and keep returning the items
+    assert len(rss.fetch_recent(url, hours=hours)) == 1
+    assert len(rss.fetch_recent(url, hours=hours)) == 1
+    assert sent == [{}, {}]
+
+    # With one, an unchanged feed is served from the cached items
+    cache = {}
+    assert len(rss.fetch_recent(url, hours=hours, cache=cache)) == 1
+    assert len(rss.fetch_recent(url, hours=hours, cache=cache)) == 1
+    assert sent[2] == {} and sent[3]["If-None-Match"] == '"abc"'
+
+    # A cache-less fetch of the changed feed must not make the cached one look unchanged
+    second = "<item><title>Item Two</title><guid>2</guid><pubDate>Tue, 17 Feb 2026 11:00:00 GMT</pubDate></item>"
+    feed["body"] = SAMPLE_FEED.replace("<item>", second + "<item>", 1)
+    assert len(rss.fetch_recent(url, hours=hours)) == 2
+    assert len(rss.fetch_recent(url, hours=hours, cache=cache)) == 2
+    assert len(cache[url].items) == 2
+
+
+def test_fetch_recent_refetches_for_a_wider_window(monkeypatch):
+    monkeypatch.setattr(rss, "_try_fetch_article_content", lambda url: (None, []))
+    now = datetime.now(timezone.utc)
+    items = "".join(
+        f"<item><title>Item {i}</title><guid>{i}</guid>"
+        f"<pubDate>{format_datetime(now - timedelta(minutes=minutes))}</pubDate></item>"
+        for i, minutes in ((1, 30), (2, 300))
+    )
+    body = f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{items}</channel></rss>'
+    sent = []
+
+    def fake_get(url, headers=None, **kwargs):
+        sent.append(headers or {})
+        return SimpleNamespace(
+            status_code=200,
+            content=body.encode(),
+            headers={"etag": '"abc"', "content-type": "application/rss+xml"},
+            raise_for_status=lambda: None,
+        )
+
+    monkeypatch.setattr(rss, "get_limited", fake_get)
+    url = "http://example.com/feed.xml"
+    cache = {}
+
+    assert len(rss.fetch_recent(url, hours=1, cache=cache)) == 1
+    # The cached items were cut to one hour, so a 24 hour window is fetched in full
+    assert len(rss.fetch_recent(url, hours=24, cache=cache)) == 2
+    assert sent[1] == {}
+    # A narrower window is served from the cache again
+    assert len(rss.fetch_recent(url, hours=1, cache=cache)) == 1
+    assert sent[2]["If-None-Match"] == '"abc"'
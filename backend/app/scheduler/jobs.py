@@ -1,11 +1,48 @@
-"""APScheduler job registration stubs.
+"""APScheduler job registration.
 
-Provide `register_jobs(scheduler)` which can be implemented later to
-attach recurring jobs.
+`register_jobs(scheduler)` attaches the recurring ingestion job. Use an
+`AsyncIOScheduler` so the scheduler shares the process's event loop; the
+job itself is synchronous and runs on the loop's default thread pool.
 """
+from __future__ import annotations
 
+from typing import Optional
 
-def register_jobs(scheduler):
-    """Register job functions with an APScheduler instance (stub)."""
-    # Example: scheduler.add_job(func, 'cron', hour='*/1')
-    return None
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import BaseScheduler
+
+INGEST_INTERVAL_MINUTES = 15
+
+
+def _ingest() -> None:
+    # Imported lazily, like main.py, so the backend package does not pull in scripts/ at import time
+    from scripts import url_links
+
+    url_links.run_default(out="combined_recent.json", hours=24)
+
+
+def register_jobs(scheduler: Optional[BaseScheduler] = None) -> BaseScheduler:
+    """Register the ingestion job on `scheduler` (a new `AsyncIOScheduler` if None) and return it.
+
+    A single job covers all sources. `coalesce` and `max_instances=1`
+    mean that runs missed while the process was paused, or that fall due
+    while one is still going, collapse into one run instead of piling up.
+    Also installs `url_links.install_sighup_handler()`.
+    """
+    from scripts import url_links
+
+    # A long-running scheduler is where `kill -HUP` should drop memoized results
+    url_links.install_sighup_handler()
+    if scheduler is None:
+        scheduler = AsyncIOScheduler()
+    scheduler.add_job(
+        _ingest,
+        "interval",
+        minutes=INGEST_INTERVAL_MINUTES,
+        id="ingest",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=60,
+    )
+    return scheduler
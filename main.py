@@ -1,15 +1,8 @@
 def main():
     # Run RSS and social scrapers in sync and write a combined JSON file.
     try:
-        import json
         from scripts import url_links
 
-        # Import scraper modules inside function to avoid network work at import time
-        from backend.app.ingest import rss as rss_module
-        from backend.app.ingest import social as social_module
-
-        combined = []
-
         # Use the runner in scripts.url_links which reads WEB_FEEDS and REDDIT_COMMUNITIES
         try:
             count = url_links.run_default(out="combined_recent.json", hours=24)
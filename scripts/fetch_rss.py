@@ -1,16 +1,39 @@
 #!/usr/bin/env python3
 """Simple CLI to fetch recent RSS entries and save to JSON.
 
+Feeds are downloaded concurrently on one event loop; each body is parsed
+in the shared process pool (`rss.get_parse_pool()`), so CPU-bound XML/HTML
+parsing runs on all cores instead of serializing on the GIL.
+
 Usage:
   python scripts/fetch_rss.py --url URL --out recent.json
 """
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
 import sys
+from typing import Any, Dict, List, MutableMapping, Optional
 
+from backend.app.cache import items as items_cache
+from backend.app.core import jsonio
 from backend.app.ingest import rss
+from backend.app.ingest._http import async_client
+
+
+async def _fetch_all(
+    urls: List[str], hours: int, timeout: int, cache: Optional[MutableMapping[str, Any]] = None
+) -> List[Any]:
+    """Fetch all feeds concurrently; each result is a list of items or the exception raised."""
+    slots: Dict[str, asyncio.Semaphore] = {}
+    async with async_client() as client:
+        return await asyncio.gather(
+            *(
+                rss.fetch_recent_async(client, url, hours=hours, timeout=timeout, slots=slots, cache=cache)
+                for url in urls
+            ),
+            return_exceptions=True,
+        )
 
 
 def main() -> int:
@@ -19,43 +42,36 @@ def main() -> int:
     p.add_argument("--hours", type=int, default=24, help="How many hours back to collect (default: 24)")
     p.add_argument("--out", default="recent.json", help="Output JSON file path")
     p.add_argument("--timeout", type=int, default=10, help="HTTP timeout seconds")
+    p.add_argument(
+        "--no-cache", action="store_true", help="Ignore items cached from previous runs and refetch every feed"
+    )
     args = p.parse_args()
 
     urls = args.url or []
 
     # If no --url provided, accept piped input or interactive pasted links
     if not urls:
-        if not sys.stdin.isatty():
-            data = sys.stdin.read()
-            urls = [line.strip() for line in data.splitlines() if line.strip()]
-        else:
-            print("Paste feed URLs (one per line). End with an empty line:")
-            lines = []
-            while True:
-                try:
-                    line = input().strip()
-                except EOFError:
-                    break
-                if line == "":
-                    break
-                lines.append(line)
-            urls = lines
+        if sys.stdin.isatty():
+            print("Paste feed URLs (one per line). End with Ctrl-D (Ctrl-Z then Enter on Windows):")
+        # URLs never contain whitespace, so one bytes.split() both splits lines and drops blanks
+        urls = [u.decode("utf-8", errors="replace") for u in sys.stdin.buffer.read().split()]
 
     if not urls:
         print("No URLs provided.", file=sys.stderr)
         return 2
 
-    combined = []
-    for url in urls:
-        try:
-            items = rss.fetch_recent(url, hours=args.hours, timeout=args.timeout)
-            combined.extend(items)
-            print(f"Fetched {len(items)} items from")
-        except Exception as e:
-            print(f"Skipped {url}: {e}", file=sys.stderr)
-
-    with open(args.out, "w", encoding="utf-8") as fh:
-        json.dump(combined, fh, ensure_ascii=False, indent=2)
+    combined: List[Dict[str, Any]] = []
+    # An empty mapping makes every fetch unconditional without persisting anything
+    cache = {} if args.no_cache else items_cache.get_cache()
+    results = asyncio.run(_fetch_all(urls, args.hours, args.timeout, cache))
+    for url, items in zip(urls, results):
+        if isinstance(items, Exception):
+            print(f"Skipped {url}: {items}", file=sys.stderr)
+            continue
+        combined.extend(items)
+        print(f"Fetched {len(items)} items from {url}")
+
+    jsonio.write_bytes(args.out, jsonio.dumps(combined))
 
     print(f"Wrote {len(combined)} total entries to {args.out}")
     return 0
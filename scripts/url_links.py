@@ -4,12 +4,21 @@ This module exposes:
 - `process_urls(urls, out, hours, timeout)` — process a list of URLs and write combined JSON.
 - `run_from_pasted_text(pasted_text, out, hours, timeout)` — split pasted text into URLs and run.
 - `paste_and_run()` — interactive prompt for pasting links, then runs the scraper.
+- `install_sighup_handler()` — let `kill -HUP` clear memoized results in long-running processes.
 """
 from __future__ import annotations
 
-import json
-from typing import Iterable, List
-
+from functools import lru_cache
+from itertools import chain
+import signal
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from backend.app.cache.bodies import canonical_url
+from backend.app.cache.seen import get_seen
+from backend.app.core import jsonio
 from backend.app.ingest import social
 
 # Two separate lists: web feeds (RSS/HTML) and reddit community links
@@ -24,53 +33,129 @@ REDDIT_COMMUNITIES = [
 ]
 
 
-def run_default(out: str = "recent.json", hours: int = 24, timeout: int = 10) -> int:
-    """Run scrapers for `WEB_FEEDS` and `REDDIT_COMMUNITIES` and write combined output."""
-    combined = []
-
-    if WEB_FEEDS:
-        try:
-            items = social.collect_from_urls(WEB_FEEDS, hours=hours, timeout=timeout)
-            combined.extend(items)
-            print(f"Collected {len(items)} items from WEB_FEEDS")
-        except Exception as e:
-            print("Failed collecting WEB_FEEDS:", e)
-
-    if REDDIT_COMMUNITIES:
-        try:
-            items = social.collect_from_urls(REDDIT_COMMUNITIES, hours=hours, timeout=timeout)
-            combined.extend(items)
-            print(f"Collected {len(items)} items from REDDIT_COMMUNITIES")
-        except Exception as e:
-            print("Failed collecting REDDIT_COMMUNITIES:", e)
-
-    # write combined output
-    import json
-
-    with open(out, "w", encoding="utf-8") as fh:
-        json.dump(combined, fh, ensure_ascii=False, indent=2)
-
-    print(f"Wrote {len(combined)} total entries to {out}")
-    return len(combined)
+@lru_cache(maxsize=4096)
+def _norm(url: str) -> str:
+    """Dedup key for `url`: lowercased scheme/host, no tracking params or trailing slash."""
+    return canonical_url(url).rstrip("/")
+
+
+def _dedup(urls: Iterable[str]) -> List[str]:
+    """Drop URLs that normalize to one already seen, keeping the first spelling."""
+    seen: dict[str, str] = {}
+    for url in urls:
+        seen.setdefault(_norm(url), url)
+    return list(seen.values())
+
+
+# A past minute bucket is never requested again, so only the latest result is kept
+@lru_cache(maxsize=1)
+def _cached_collect(
+    urls: Tuple[str, ...], hours: int, timeout: int, minute_bucket: int
+) -> List[List[Dict[str, Any]]]:
+    """`social.collect_by_url` memoized per wall-clock minute (`minute_bucket`)."""
+    return social.collect_by_url(urls, hours=hours, timeout=timeout)
+
+
+def _collect(urls: Iterable[str], hours: int, timeout: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Collect `urls` (deduped) and map each `_norm` key to its items.
+
+    An identical call in the same minute reuses the earlier result. The
+    returned dict is a fresh object, so callers may pop from it.
+    """
+    unique = tuple(_dedup(urls))
+    groups = _cached_collect(unique, hours, timeout, int(time.time() // 60))
+    return {_norm(url): items for url, items in zip(unique, groups)}
+
+
+def _clear_collect_cache(signum: int, frame: Any) -> None:
+    _cached_collect.cache_clear()
+
+
+def install_sighup_handler() -> bool:
+    """Make `kill -HUP` drop memoized results instead of terminating the process.
+
+    Meant for long-running entry points (the scheduler); importing this
+    module leaves SIGHUP alone. Only installs the handler from the main
+    thread and when nothing else claimed SIGHUP; returns whether it did.
+    """
+    if (
+        hasattr(signal, "SIGHUP")
+        and threading.current_thread() is threading.main_thread()
+        and signal.getsignal(signal.SIGHUP) is signal.SIG_DFL
+    ):
+        signal.signal(signal.SIGHUP, _clear_collect_cache)
+        return True
+    return False
+
+
+def _unseen(items: List[Dict[str, Any]], keys: Set[str]) -> List[Dict[str, Any]]:
+    """Drop items emitted by an earlier run or already in `keys` (keyed by id, else link).
+
+    The keys of the returned items are added to `keys`; they are only
+    recorded in the seen set once the output is written.
+    """
+    seen = get_seen()
+    fresh = []
+    for it in items:
+        key = it.get("id") or it.get("link")
+        if not key:
+            fresh.append(it)
+        elif key not in keys and key not in seen:
+            keys.add(key)
+            fresh.append(it)
+    return fresh
+
+
+def run_default(out: str = "recent.json", hours: int = 24, timeout: int = 10, skip_seen: bool = True) -> int:
+    """Run scrapers for `WEB_FEEDS` and `REDDIT_COMMUNITIES` and write combined output.
+
+    Unless `skip_seen` is False, items written by earlier runs are left out
+    (see `backend.app.cache.seen`).
+    """
+    # One collection pass over both lists so they share the connection pool
+    # and event loop; items are then attributed back to their list by URL.
+    try:
+        by_url = _collect([*WEB_FEEDS, *REDDIT_COMMUNITIES], hours, timeout)
+    except Exception as e:
+        print("Failed collecting WEB_FEEDS / REDDIT_COMMUNITIES:", e)
+        by_url = {}
+
+    parts: List[List[Dict[str, Any]]] = []
+    new_keys: Set[str] = set()
+    for name, urls in (("WEB_FEEDS", WEB_FEEDS), ("REDDIT_COMMUNITIES", REDDIT_COMMUNITIES)):
+        if not urls:
+            continue
+        # pop, so a URL listed in both categories is only written once
+        items = [it for url in urls for it in by_url.pop(_norm(url), ())]
+        if skip_seen:
+            items = _unseen(items, new_keys)
+        parts.append(items)
+        print(f"Collected {len(items)} items from {name}")
+
+    # write combined output, streaming items instead of concatenating the parts
+    count = jsonio.write_array(out, chain.from_iterable(parts))
+    # Only remember the items once they are safely written out
+    seen = get_seen()
+    seen.update(new_keys)
+    seen.flush()
+
+    print(f"Wrote {count} total entries to {out}")
+    return count
 
 
 def run_from_pasted_text(pasted_text: str, out: str = "recent.json", hours: int = 24, timeout: int = 10) -> int:
-    urls = [line.strip() for line in pasted_text.splitlines() if line.strip()]
-    return social.process_url_list(urls, out=out, hours=hours, timeout=timeout)
+    items = list(chain.from_iterable(_collect(pasted_text.split(), hours, timeout).values()))
+    jsonio.write_bytes(out, jsonio.dumps(items))
+
+    print(f"Wrote {len(items)} total entries to {out}")
+    return len(items)
 
 
 def paste_and_run(out: str = "recent.json", hours: int = 24, timeout: int = 10) -> int:
-    print("Paste feed URLs (one per line). End with an empty line:")
-    lines: List[str] = []
-    while True:
-        try:
-            line = input().strip()
-        except EOFError:
-            break
-        if line == "":
-            break
-        lines.append(line)
-    return social.process_url_list(lines, out=out, hours=hours, timeout=timeout)
+    print("Paste feed URLs (one per line). End with Ctrl-D (Ctrl-Z then Enter on Windows):")
+    # One read of the whole paste instead of a line-buffered input() per URL
+    lines = sys.stdin.read().split()
+    return social.process_url_list(_dedup(lines), out=out, hours=hours, timeout=timeout)
 
 
 if __name__ == "__main__":